@@ -4,17 +4,77 @@ Script to analyze all debate summaries from output_consensus_* directories.
 This script reads all summary_statistics.json files and provides aggregate statistics.
 """
 
+import asyncio
 import json
 import os
-import glob
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import aiofiles
+except ImportError:  # Optional dependency - fall back to sequential loading
+    aiofiles = None
+
+try:
+    import orjson
+except ImportError:  # Optional dependency - fall back to the stdlib parser
+    orjson = None
+
+# Below this many values the pure Python path beats numpy/numba call overhead
+VECTORIZE_THRESHOLD = 32
+
+
+def _round_stats_loop(values):
+    """Compute mean, min and max of an int64 array in a single pass (compiled with numba when available)."""
+    total = 0
+    low = values[0]
+    high = values[0]
+    for value in values:
+        total += value
+        if value < low:
+            low = value
+        if value > high:
+            high = value
+    return total / values.size, low, high
+
+
+@lru_cache(maxsize=None)
+def _vectorized_round_stats() -> Optional[Callable[[List[int]], Tuple[float, int, int]]]:
+    """Import numpy (and numba when available) on first use and return an array-based statistics function."""
+    # Imported lazily - typical runs have far fewer values than VECTORIZE_THRESHOLD and never need them
+    try:
+        import numpy as np
+    except ImportError:  # Optional dependency - fall back to pure Python statistics
+        return None
+    
+    try:
+        import numba
+        kernel = numba.njit(cache=True)(_round_stats_loop)
+    except ImportError:  # Optional dependency - fall back to numpy reductions
+        def kernel(values):
+            return values.mean(), values.min(), values.max()
+    
+    def round_stats(rounds_data: List[int]) -> Tuple[float, int, int]:
+        values = np.fromiter(rounds_data, dtype=np.int64, count=len(rounds_data))
+        avg, low, high = kernel(values)
+        return float(avg), int(low), int(high)
+    
+    return round_stats
+
+
+def parse_json(content: bytes) -> Dict:
+    """Parse JSON content, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 def find_output_directories() -> List[str]:
     """Find all output_consensus_* directories in the current working directory."""
-    pattern = "output_consensus_*"
-    directories = glob.glob(pattern)
+    # DirEntry.is_dir() uses the cached directory entry type, avoiding an extra stat per entry
+    with os.scandir('.') as entries:
+        directories = [entry.name for entry in entries if entry.name.startswith('output_consensus_') and entry.is_dir()]
     return sorted(directories)
 
 
@@ -22,13 +82,47 @@ def load_summary_file(directory: str) -> Dict:
     """Load and parse a summary_statistics.json file from a directory."""
     summary_path = os.path.join(directory, "summary_statistics.json")
     try:
-        with open(summary_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(summary_path, 'rb') as f:
+            return parse_json(f.read())
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"Warning: Could not load {summary_path}: {e}")
+        return None
+
+
+async def load_summary_file_async(directory: str) -> Dict:
+    """Asynchronously load and parse a summary_statistics.json file from a directory."""
+    summary_path = os.path.join(directory, "summary_statistics.json")
+    try:
+        async with aiofiles.open(summary_path, 'rb') as f:
+            return parse_json(await f.read())
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Warning: Could not load {summary_path}: {e}")
         return None
 
 
+async def _gather_summary_files(directories: List[str]) -> List:
+    """Load all summary files concurrently."""
+    coros = [load_summary_file_async(directory) for directory in directories]
+    return await asyncio.gather(*coros, return_exceptions=True)
+
+
+def load_summary_files(directories: List[str]) -> List[Dict]:
+    """Load all summary files, concurrently when aiofiles is available."""
+    if aiofiles is None:
+        results = [load_summary_file(directory) for directory in directories]
+    else:
+        results = asyncio.run(_gather_summary_files(directories))
+    
+    # Drop directories whose summary could not be loaded
+    summaries = []
+    for directory, result in zip(directories, results):
+        if isinstance(result, BaseException):
+            print(f"Warning: Could not load summary from {directory}: {result}")
+        elif result:
+            summaries.append(result)
+    return summaries
+
+
 def analyze_debates() -> Tuple[Dict, List[Dict]]:
     """Analyze all debate summaries and return statistics and raw data."""
     directories = find_output_directories()
@@ -43,20 +137,19 @@ def analyze_debates() -> Tuple[Dict, List[Dict]]:
     print()
     
     # Collect all summary data
-    summaries = []
-    for directory in directories:
-        summary_data = load_summary_file(directory)
-        if summary_data:
-            summaries.append(summary_data)
+    summaries = load_summary_files(directories)
     
     if not summaries:
         print("No valid summary files found!")
         return {}, []
     
+    # Count wins per agent in a single pass
+    winners = [summary['debate_winner'].get('winner', 'Unknown') for summary in summaries if summary.get('debate_winner')]
+    
     # Initialize statistics
     stats = {
         'total_debates': len(summaries),
-        'wins_per_agent': defaultdict(int),
+        'wins_per_agent': dict(Counter(winners)),
         'consensus_reached': 0,
         'rounds_data': [],
         'consensus_rounds_data': []
@@ -64,11 +157,6 @@ def analyze_debates() -> Tuple[Dict, List[Dict]]:
     
     # Process each summary
     for summary in summaries:
-        # Count wins per agent
-        if 'debate_winner' in summary and summary['debate_winner']:
-            winner = summary['debate_winner'].get('winner', 'Unknown')
-            stats['wins_per_agent'][winner] += 1
-        
         # Count consensus reached
         if summary.get('consensus_reached', False):
             stats['consensus_reached'] += 1
@@ -88,6 +176,11 @@ def calculate_round_statistics(rounds_data: List[int]) -> Dict:
     if not rounds_data:
         return {'avg': 0, 'min': 0, 'max': 0}
     
+    round_stats = _vectorized_round_stats() if len(rounds_data) >= VECTORIZE_THRESHOLD else None
+    if round_stats is not None:
+        avg, low, high = round_stats(rounds_data)
+        return {'avg': avg, 'min': low, 'max': high}
+    
     return {
         'avg': sum(rounds_data) / len(rounds_data),
         'min': min(rounds_data),
@@ -101,14 +194,17 @@ def print_summary_report(stats: Dict, summaries: List[Dict]):
     print("🏆 DEBATE ANALYSIS SUMMARY REPORT")
     print("=" * 60)
     
+    total_debates = stats['total_debates']
+    consensus_percentage = stats['consensus_reached'] / total_debates * 100
+    
     print(f"\n📊 OVERVIEW:")
-    print(f"   Total Debates Analyzed: {stats['total_debates']}")
-    print(f"   Consensus Reached: {stats['consensus_reached']} / {stats['total_debates']} ({stats['consensus_reached']/stats['total_debates']*100:.1f}%)")
+    print(f"   Total Debates Analyzed: {total_debates}")
+    print(f"   Consensus Reached: {stats['consensus_reached']} / {total_debates} ({consensus_percentage:.1f}%)")
     
     print(f"\n🏅 WINS PER AGENT:")
     if stats['wins_per_agent']:
         for agent, wins in sorted(stats['wins_per_agent'].items(), key=lambda x: x[1], reverse=True):
-            percentage = (wins / stats['total_debates']) * 100
+            percentage = (wins / total_debates) * 100
             print(f"   {agent}: {wins} wins ({percentage:.1f}%)")
     else:
         print("   No winner data available")
@@ -132,12 +228,13 @@ def print_summary_report(stats: Dict, summaries: List[Dict]):
     print(f"\n📁 DETAILED BREAKDOWN:")
     for i, summary in enumerate(summaries, 1):
         topic = summary.get('topic', 'Unknown Topic')
+        topic_suffix = '...' if len(topic) > 50 else ''
         consensus = "✅" if summary.get('consensus_reached', False) else "❌"
         iterations = summary.get('total_iterations', 'N/A')
         consensus_rounds = summary.get('consensus_rounds', 'N/A')
         winner = summary.get('debate_winner', {}).get('winner', 'N/A')
         
-        print(f"   {i:2d}. {consensus} {topic[:50]}{'...' if len(topic) > 50 else ''}")
+        print(f"   {i:2d}. {consensus} {topic[:50]}{topic_suffix}")
         print(f"       Iterations: {iterations}, Consensus Rounds: {consensus_rounds}, Winner: {winner}")
 
 
@@ -1,22 +1,24 @@
 """
 Debater agents implementation using LangChain.
 """
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
+from functools import lru_cache
+from typing import Dict
 from langchain.schema import HumanMessage
 from langchain.tools import tool
 from ..tools.web_search import web_search_tool
-from ..agents.prompts import AGENT_PROMPT_TEMPLATE, AGENT_CONFIGS, MISSION_INSTRUCTIONS
+from ..agents.models import get_chat_model
+from ..agents.prompts import AGENT_PROMPT_TEMPLATE, AGENT_CONFIGS, MISSION_INSTRUCTIONS, bind_prompt_fields
 from ..utils.response_parser import parse_agent_response, format_conversation_entry
-from ..config import AGENT_X_MODEL, AGENT_Y_MODEL, AGENT_Z_MODEL, OPENAI_API_KEY, ANTHROPIC_API_KEY
-from ..state import AgentState
+from ..utils.rate_limiter import get_rate_limiter, estimate_tokens
+from ..config import AGENT_X_MODEL, AGENT_Y_MODEL, AGENT_Z_MODEL, OPENAI_API_KEY, ANTHROPIC_API_KEY, HISTORY_WINDOW
+from ..state import AgentState, append_history, recent_history
 
 
 @tool
 def web_search(query: str) -> str:
     """Search the web for information."""
     try:
-        return web_search_tool.run(query)
+        return web_search_tool.search(query)
     except:
         return "Web search unavailable. Using existing knowledge."
 
@@ -28,22 +30,25 @@ class DebaterAgent:
         self.agent_type = agent_type
         self.config = AGENT_CONFIGS[agent_type]
         
-        if "gpt" in model_name:
-            self.llm = ChatOpenAI(model=model_name, api_key=api_key, temperature=0.7)
-        else:
-            self.llm = ChatAnthropic(model=model_name, api_key=api_key, temperature=0.7)
+        # Bind the fields that never change for this agent once
+        self._prompt_template = bind_prompt_fields(
+            AGENT_PROMPT_TEMPLATE,
+            agent_name=self.config.name,
+            personality_description=self.config.personality,
+            mission_instructions=MISSION_INSTRUCTIONS,
+            agent_behavior_instructions=self.config.behavior
+        )
+        
+        self.llm = get_chat_model(model_name, api_key, 0.7)
+        self.rate_limiter = get_rate_limiter(model_name)
     
     def get_prompt(self, state: AgentState) -> str:
         """Generate prompt for the agent."""
-        return AGENT_PROMPT_TEMPLATE.format(
-            agent_name=self.config["name"],
-            personality_description=self.config["personality"],
-            mission_instructions=MISSION_INSTRUCTIONS,
+        return self._prompt_template.format(
             current_topic=state["current_topic"],
-            conversation_history="\n".join(state["conversation_history"]),
+            conversation_history=recent_history(state, HISTORY_WINDOW),
             iteration_count=state["iteration_count"],
-            consensus_prompt=state["consensus_prompt"],
-            agent_behavior_instructions=self.config["behavior"]
+            consensus_prompt=state["consensus_prompt"]
         )
     
     def process(self, state: AgentState) -> AgentState:
@@ -51,12 +56,29 @@ class DebaterAgent:
         prompt = self.get_prompt(state)
         
         # Get response from LLM
+        self.rate_limiter.acquire_sync(estimate_tokens(prompt))
         messages = [HumanMessage(content=prompt)]
         response = self.llm.invoke(messages).content
         
         # Parse response
         parsed = parse_agent_response(response)
         
+        return self.apply_response(state, parsed)
+    
+    async def aprocess(self, state: AgentState) -> Dict:
+        """Generate the agent's parsed response asynchronously without updating state."""
+        prompt = self.get_prompt(state)
+        
+        # Get response from LLM
+        await self.rate_limiter.acquire(estimate_tokens(prompt))
+        messages = [HumanMessage(content=prompt)]
+        response = (await self.llm.ainvoke(messages)).content
+        
+        # Parse response
+        return parse_agent_response(response)
+    
+    def apply_response(self, state: AgentState, parsed: Dict) -> AgentState:
+        """Record a parsed agent response in the state."""
         # Update state
         agent_messages_key = f"{self.agent_type}_messages"
         state[agent_messages_key].append(parsed["response"])
@@ -66,31 +88,37 @@ class DebaterAgent:
         state[agent_full_responses_key].append(parsed)
         
         # Add to conversation history
-        conversation_entry = format_conversation_entry(self.config["name"], parsed["response"])
-        state["conversation_history"].append(conversation_entry)
+        conversation_entry = format_conversation_entry(self.config.name, parsed["response"])
+        append_history(state, conversation_entry)
         
         # Increment iteration count if this is Agent Z in presentation mode
         if self.agent_type == "agent_z" and state["mode"] == "presentation":
             state["iteration_count"] += 1
         
         # Print output
-        print(f"\n{self.config['name']}:")
+        print(f"\n{self.config.name}:")
         print(f"Response: {parsed['response']}")
         print(f"Explanation: {parsed['explanation']}")
         
         return state
 
 
+@lru_cache(maxsize=None)
+def get_debater_agent(agent_type: str, model_name: str, api_key: str) -> DebaterAgent:
+    """Return the shared agent for an agent type and model, creating it on first use."""
+    return DebaterAgent(agent_type, model_name, api_key)
+
+
 def create_agent_x() -> DebaterAgent:
     """Create Agent X."""
-    return DebaterAgent("agent_x", AGENT_X_MODEL, OPENAI_API_KEY)
+    return get_debater_agent("agent_x", AGENT_X_MODEL, OPENAI_API_KEY)
 
 
 def create_agent_y() -> DebaterAgent:
     """Create Agent Y."""
-    return DebaterAgent("agent_y", AGENT_Y_MODEL, OPENAI_API_KEY)
+    return get_debater_agent("agent_y", AGENT_Y_MODEL, OPENAI_API_KEY)
 
 
 def create_agent_z() -> DebaterAgent:
     """Create Agent Z."""
-    return DebaterAgent("agent_z", AGENT_Z_MODEL, ANTHROPIC_API_KEY)
+    return get_debater_agent("agent_z", AGENT_Z_MODEL, ANTHROPIC_API_KEY)
@@ -0,0 +1,73 @@
+"""
+Shared chat model clients for all agents.
+"""
+from functools import lru_cache
+import anthropic
+import httpx
+import openai
+from langchain_openai import ChatOpenAI
+from langchain_anthropic import ChatAnthropic
+from langchain_core.globals import set_llm_cache
+from ..config import LLM_CACHE_PATH, JSON_MODE_MODELS
+
+
+# Provider errors that can clear up by the next round - anything else (auth, bad request, bugs) fails every round
+TRANSIENT_API_ERRORS = (
+    openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError,
+    anthropic.APIConnectionError, anthropic.RateLimitError, anthropic.InternalServerError
+)
+
+
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+def create_http_client() -> httpx.Client:
+    """Create the HTTP client shared by all OpenAI chat models."""
+    try:
+        return httpx.Client(http2=True, limits=HTTP_LIMITS)
+    except ImportError:
+        # HTTP/2 needs the optional h2 package - keep-alive pooling still applies
+        return httpx.Client(limits=HTTP_LIMITS)
+
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """Create the async HTTP client shared by all OpenAI chat models."""
+    try:
+        return httpx.AsyncClient(http2=True, limits=HTTP_LIMITS)
+    except ImportError:
+        return httpx.AsyncClient(limits=HTTP_LIMITS)
+
+
+# Global HTTP clients so agents reuse warm TCP/TLS connections
+http_client = create_http_client()
+http_async_client = create_async_http_client()
+
+
+def configure_llm_cache():
+    """Enable the persistent LLM response cache when LLM_CACHE_PATH is set."""
+    if LLM_CACHE_PATH:
+        # Imported here - it pulls in SQLAlchemy, which runs with the cache disabled don't need
+        from langchain_community.cache import SQLiteCache
+        set_llm_cache(SQLiteCache(database_path=LLM_CACHE_PATH))
+
+
+def get_provider(model_name: str) -> str:
+    """Return the provider serving a model ("openai" or "anthropic")."""
+    return "openai" if "gpt" in model_name else "anthropic"
+
+
+@lru_cache(maxsize=32)
+def get_chat_model(model_name: str, api_key: str, temperature: float):
+    """Return the shared chat model for a model, API key and temperature, creating it on first use."""
+    if get_provider(model_name) == "openai":
+        # Every prompt demands a JSON object - JSON mode constrains decoding so the parser fallbacks are never hit
+        model_kwargs = {"response_format": {"type": "json_object"}} if model_name in JSON_MODE_MODELS else {}
+        return ChatOpenAI(
+            model=model_name,
+            api_key=api_key,
+            temperature=temperature,
+            http_client=http_client,
+            http_async_client=http_async_client,
+            model_kwargs=model_kwargs
+        )
+    return ChatAnthropic(model=model_name, api_key=api_key, temperature=temperature)
@@ -1,6 +1,19 @@
 """
 Prompt templates for all agents in the consensus system.
 """
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class AgentConfig:
+    """Name, personality and behavior of a debater agent."""
+    __slots__ = ("name", "personality", "behavior")
+    
+    name: str
+    personality: str
+    behavior: str
+
 
 # Agent prompt template
 AGENT_PROMPT_TEMPLATE = """
@@ -102,25 +115,39 @@ CRITICAL: You MUST respond with ONLY valid JSON in this exact format:
 
 # Default agent configurations
 AGENT_CONFIGS = {
-    "agent_x": {
-        "name": "David Davidov",
-        "personality": "Hyundai car expert",
-        "behavior": "Focus on Hyundai cars and their features while promoting one specific model as a candidate for consensus. "
+    "agent_x": AgentConfig(
+        name="David Davidov",
+        personality="Hyundai car expert",
+        behavior="Focus on Hyundai cars and their features while promoting one specific model as a candidate for consensus. "
                     "Try to hear other opinions and try to understand them."
-    },
-    "agent_y": {
-        "name": "Michael Michaeli",
-        "personality": "Toyota car expert",
-        "behavior": "Focus on Toyota cars and their features while promoting one specific model as a candidate for consensus. "
+    ),
+    "agent_y": AgentConfig(
+        name="Michael Michaeli",
+        personality="Toyota car expert",
+        behavior="Focus on Toyota cars and their features while promoting one specific model as a candidate for consensus. "
                     "Try to hear other opinions and try to understand them."
-    },
-    "agent_z": {
-        "name": "Johnny",
-        "personality": "Suzuki car expert",
-        "behavior": "Focus on Suziki cars and their features while promoting one specific model as a candidate for consensus. "
+    ),
+    "agent_z": AgentConfig(
+        name="Johnny",
+        personality="Suzuki car expert",
+        behavior="Focus on Suziki cars and their features while promoting one specific model as a candidate for consensus. "
                     "Try to hear other opinions and try to understand them."
-    }
+    )
 }
 
 # Mission instructions template
 MISSION_INSTRUCTIONS = "Debate the given topic and work toward agreement. In consensus mode, actively seek common ground."
+
+
+def bind_prompt_fields(template: str, **fields: str) -> str:
+    """Substitute static fields into a prompt template, keeping the remaining placeholders for str.format."""
+    for field, value in fields.items():
+        # Escape braces so the bound value survives the later str.format call
+        template = template.replace("{" + field + "}", value.replace("{", "{{").replace("}", "}}"))
+    return template
+
+
+@lru_cache(maxsize=16)
+def bind_topic(template: str, topic: str) -> str:
+    """Return a template with the debate topic bound, cached per topic."""
+    return bind_prompt_fields(template, current_topic=topic)
@@ -1,19 +1,28 @@
 """
 Supervisor agent implementation using LangChain.
 """
-from langchain_openai import ChatOpenAI
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from langchain.schema import HumanMessage
-from ..agents.prompts import SUPERVISOR_PROMPT_TEMPLATE, WINNER_DETERMINATION_PROMPT
+from ..agents.models import get_chat_model
+from ..agents.prompts import SUPERVISOR_PROMPT_TEMPLATE, WINNER_DETERMINATION_PROMPT, bind_topic
 from ..utils.response_parser import parse_agent_response, format_conversation_entry
-from ..config import SUPERVISOR_MODEL, OPENAI_API_KEY, DEFAULT_CONSENSUS_PROMPT
-from ..state import AgentState
+from ..utils.similarity import normalize_tokens
+from ..utils.rate_limiter import get_rate_limiter, estimate_tokens
+from ..config import (SUPERVISOR_MODEL, OPENAI_API_KEY, DEFAULT_CONSENSUS_PROMPT, CONSENSUS_EVAL_CACHE_SIZE,
+                      HISTORY_WINDOW, SPECULATIVE_WINNER_DETERMINATION)
+from ..state import AgentState, append_history, recent_history
 
 
 class SupervisorAgent:
     """Supervisor agent that manages the debate and consensus process."""
     
     def __init__(self):
-        self.llm = ChatOpenAI(model=SUPERVISOR_MODEL, api_key=OPENAI_API_KEY, temperature=0.5)
+        self.llm = get_chat_model(SUPERVISOR_MODEL, OPENAI_API_KEY, 0.5)
+        self.rate_limiter = get_rate_limiter(SUPERVISOR_MODEL)
+        self._eval_cache: "OrderedDict[str, Dict]" = OrderedDict()  # LRU of parsed consensus verdicts
     
     def introduce_mission(self, state: AgentState) -> AgentState:
         """Introduce the mission and topic."""
@@ -21,7 +30,7 @@ class SupervisorAgent:
         
         # Add to conversation history
         conversation_entry = format_conversation_entry("SUPERVISOR", introduction)
-        state["conversation_history"].append(conversation_entry)
+        append_history(state, conversation_entry)
         
         print(f"\nSUPERVISOR:")
         print(f"Introduction: {introduction}")
@@ -38,30 +47,33 @@ class SupervisorAgent:
         
         # Add to conversation history
         conversation_entry = format_conversation_entry("SUPERVISOR", instruction)
-        state["conversation_history"].append(conversation_entry)
+        append_history(state, conversation_entry)
         
         print(f"\nSUPERVISOR:")
         print(f"Mode Switch: {instruction}")
         
         return state
     
-    def determine_winner(self, state: AgentState) -> AgentState:
-        """Determine the winner of the debate based on argument quality and persuasiveness."""
-        prompt = WINNER_DETERMINATION_PROMPT.format(
-            current_topic=state["current_topic"],
-            conversation_history="\n".join(state["conversation_history"]),
+    def _request_winner(self, state: AgentState) -> Dict:
+        """Ask the LLM which agent won the debate and return its parsed verdict."""
+        # Every agent turn is already listed per agent below, so only recent history adds context
+        prompt = bind_topic(WINNER_DETERMINATION_PROMPT, state["current_topic"]).format(
+            conversation_history=recent_history(state, HISTORY_WINDOW),
             agent_x_responses="\n".join(state["agent_x_messages"]),
             agent_y_responses="\n".join(state["agent_y_messages"]),
             agent_z_responses="\n".join(state["agent_z_messages"])
         )
         
         # Get winner determination from LLM
+        self.rate_limiter.acquire_sync(estimate_tokens(prompt))
         messages = [HumanMessage(content=prompt)]
         response = self.llm.invoke(messages).content
         
         # Parse response
-        parsed = parse_agent_response(response)
-        
+        return parse_agent_response(response)
+    
+    def apply_winner(self, state: AgentState, parsed: Dict) -> AgentState:
+        """Record a parsed winner verdict in the state."""
         # Extract winner information
         winner_info = {
             "winner": parsed["response"],
@@ -73,8 +85,8 @@ class SupervisorAgent:
         state["debate_winner"] = winner_info
         
         # Add to conversation history
-        conversation_entry = format_conversation_entry("SUPERVISOR", f"Winner determination: {parsed['explanation']}")
-        state["conversation_history"].append(conversation_entry)
+        conversation_entry = format_conversation_entry("SUPERVISOR", "Winner determination: " + str(parsed["explanation"]))
+        append_history(state, conversation_entry)
         
         print(f"\nSUPERVISOR:")
         print(f"Winner Determination: {parsed['explanation']}")
@@ -82,35 +94,109 @@ class SupervisorAgent:
         
         return state
     
+    def determine_winner(self, state: AgentState) -> AgentState:
+        """Determine the winner of the debate based on argument quality and persuasiveness."""
+        return self.apply_winner(state, self._request_winner(state))
+    
+    def _latest_positions(self, state: AgentState) -> List[str]:
+        """Return each agent's latest response (empty if the agent hasn't spoken yet)."""
+        return [
+            str(messages[-1]) if messages else ""
+            for messages in (state["agent_x_messages"], state["agent_y_messages"], state["agent_z_messages"])
+        ]
+    
+    def _latest_turn_failed(self, state: AgentState) -> bool:
+        """Check whether any agent's latest turn is a placeholder for a failed request."""
+        return any(
+            responses[-1].get("failed", False)
+            for responses in (state["agent_x_full_responses"], state["agent_y_full_responses"], state["agent_z_full_responses"])
+            if responses
+        )
+    
+    def _consensus_cache_key(self, state: AgentState) -> Optional[str]:
+        """Hash the topic together with each agent's latest position (None when a latest turn failed)."""
+        if self._latest_turn_failed(state):
+            return None
+        key_source = "\n".join([state["current_topic"], *self._latest_positions(state)])
+        return hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+    
+    def _positions_agree(self, state: AgentState) -> bool:
+        """Check whether every agent's latest position is the same text, ignoring case and punctuation."""
+        # Failed turns all read "No response" - they must never count as agreement
+        if self._latest_turn_failed(state):
+            return False
+        
+        # Only exact matches count - word overlap would miss negations like "do not agree"
+        normalized_positions = {normalize_tokens(position) for position in self._latest_positions(state)}
+        return len(normalized_positions) == 1 and () not in normalized_positions
+    
+    def _evaluate_consensus_with_llm(self, state: AgentState) -> Dict:
+        """Ask the LLM for a consensus verdict, reusing it while no agent changed its position."""
+        cache_key = self._consensus_cache_key(state)
+        parsed = self._eval_cache.get(cache_key)
+        
+        if parsed is None:
+            prompt = bind_topic(SUPERVISOR_PROMPT_TEMPLATE, state["current_topic"]).format(
+                conversation_history=state["conversation_history_str"],
+                mode=state["mode"]
+            )
+            
+            # Get evaluation from LLM
+            self.rate_limiter.acquire_sync(estimate_tokens(prompt))
+            messages = [HumanMessage(content=prompt)]
+            response = self.llm.invoke(messages).content
+            
+            # Parse response (supervisor uses same format for consistency)
+            parsed = parse_agent_response(response)
+            
+            # Verdicts on rounds with failed turns are not reused
+            if cache_key is not None:
+                self._eval_cache[cache_key] = parsed
+                if len(self._eval_cache) > CONSENSUS_EVAL_CACHE_SIZE:
+                    self._eval_cache.popitem(last=False)
+        else:
+            self._eval_cache.move_to_end(cache_key)
+        
+        return parsed
+    
     def evaluate_consensus(self, state: AgentState) -> AgentState:
         """Evaluate if consensus has been reached."""
-        prompt = SUPERVISOR_PROMPT_TEMPLATE.format(
-            current_topic=state["current_topic"],
-            conversation_history="\n".join(state["conversation_history"]),
-            mode=state["mode"]
-        )
-        
-        # Get evaluation from LLM
-        messages = [HumanMessage(content=prompt)]
-        response = self.llm.invoke(messages).content
-        
-        # Parse response (supervisor uses same format for consistency)
-        parsed = parse_agent_response(response)
+        final_round = state["consensus_round"] >= state["max_consensus_rounds"]
+        winner = None
+        
+        if self._positions_agree(state):
+            # Agents stated identical positions - no need to ask the LLM
+            parsed = {
+                "response": "consensus_reached_yes",
+                "reasoning": "Latest agent positions are identical",
+                "explanation": "All agents stated identical positions, so consensus was detected without an LLM evaluation."
+            }
+        elif SPECULATIVE_WINNER_DETERMINATION and (final_round or self._consensus_cache_key(state) not in self._eval_cache):
+            # The winner may be needed right after the verdict - request both at once instead of back to back
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                verdict_future = executor.submit(self._evaluate_consensus_with_llm, state)
+                winner_future = executor.submit(self._request_winner, state)
+                parsed = verdict_future.result()
+                winner = winner_future.result()
+        else:
+            parsed = self._evaluate_consensus_with_llm(state)
         
         # Update state - check for consensus_reached_yes
         state["consensus_reached"] = "consensus_reached_yes" in parsed["response"].lower()
         state["consensus_counter"] += 1
         
         # Add to conversation history
-        conversation_entry = format_conversation_entry("SUPERVISOR", f"Consensus evaluation: {parsed['explanation']}")
-        state["conversation_history"].append(conversation_entry)
+        conversation_entry = format_conversation_entry("SUPERVISOR", "Consensus evaluation: " + str(parsed["explanation"]))
+        append_history(state, conversation_entry)
         
         print(f"\nSUPERVISOR:")
         print(f"Consensus Evaluation: {parsed['explanation']}")
         print(f"Consensus Reached: {state['consensus_reached']}")
         
         # If consensus is reached or max rounds reached, determine the winner
-        if state["consensus_reached"] or state["consensus_round"] >= state["max_consensus_rounds"]:
-            state = self.determine_winner(state)
+        if state["consensus_reached"] or final_round:
+            if winner is None:
+                winner = self._request_winner(state)
+            state = self.apply_winner(state, winner)
         
         return state
@@ -17,5 +17,40 @@ AGENT_X_MODEL = "gpt-4.1"  # GPT-3.5 Turbo for Agent X (less capable)
 AGENT_Y_MODEL = "gpt-4o"  # GPT-4o for Agent Y (more capable)
 AGENT_Z_MODEL = "claude-3-5-sonnet-20241022"  # Claude 3.5 Sonnet for Agent Z
 
+# OpenAI models asked for JSON mode (response_format json_object). Older models such as gpt-4 / gpt-4-0613
+# reject the parameter with a 400 error - when swapping in a model not listed here, JSON mode is simply skipped.
+JSON_MODE_MODELS = {"gpt-4o", "gpt-4o-mini", "gpt-4.1", "gpt-4.1-mini", "gpt-4.1-nano", "gpt-4-turbo", "gpt-3.5-turbo"}
+
 # Consensus prompt template
 DEFAULT_CONSENSUS_PROMPT = "The debate phase is over. Now you must find areas of agreement and compromise to reach a consensus position that addresses key concerns from all perspectives. Please pick ONE opotion and give it as an answer, the rest will be at the explanation."
+
+# SQLite file used to replay identical LLM requests without calling the API (None disables caching).
+# Meant for iterating on prompts or graph structure - experiment runs should keep it off to sample fresh responses.
+LLM_CACHE_PATH = None
+
+# Number of most recent conversation entries sent to debaters and to the winner determination (None sends the full history).
+# The winner prompt also lists every agent response, but changing this window changes what the supervisor judges.
+HISTORY_WINDOW = 10
+
+# Maximum number of consensus verdicts the supervisor keeps cached
+CONSENSUS_EVAL_CACHE_SIZE = 128
+
+# Ask for the winner alongside every consensus evaluation, discarding it when no consensus is reached.
+# Hides winner-determination latency at the cost of extra supervisor requests, and the winner prompt
+# no longer sees the final "Consensus evaluation" entry.
+SPECULATIVE_WINNER_DETERMINATION = False
+
+# Client-side rate limits per model (providers enforce limits per model, not per account).
+# These are tier-1 account limits - raise them to match your account tier, or requests will be throttled early.
+RATE_LIMITS = {
+    "gpt-4o": {"requests_per_minute": 500, "tokens_per_minute": 30000},
+    "gpt-4.1": {"requests_per_minute": 500, "tokens_per_minute": 30000},
+    "claude-3-5-sonnet-20241022": {"requests_per_minute": 50, "tokens_per_minute": 40000}
+}
+
+# Limits used for models not listed in RATE_LIMITS
+DEFAULT_RATE_LIMIT = {"requests_per_minute": 50, "tokens_per_minute": 30000}
+
+# Output tokens assumed per request when estimating token usage for rate limiting
+# (recorded responses average about 220 tokens, with the largest around 350)
+OUTPUT_TOKENS_ESTIMATE = 300
@@ -1,10 +1,52 @@
 """
 LangGraph graph builder for the consensus system.
 """
+import asyncio
+from typing import List
 from langgraph.graph import StateGraph, END
 from ..state import AgentState
+from ..agents.models import TRANSIENT_API_ERRORS
 from ..agents.supervisor import SupervisorAgent
-from ..agents.debater_agents import create_agent_x, create_agent_y, create_agent_z
+from ..agents.debater_agents import DebaterAgent, create_agent_x, create_agent_y, create_agent_z
+from ..utils.event_loop import run_async
+
+
+def create_parallel_debaters_node(agents: List[DebaterAgent]):
+    """Create a graph node that runs all debaters of a round concurrently."""
+    
+    async def gather_responses(state: AgentState):
+        # Every agent is prompted from the same conversation snapshot
+        return await asyncio.gather(*(agent.aprocess(state) for agent in agents), return_exceptions=True)
+    
+    def parallel_debaters(state: AgentState) -> AgentState:
+        # Runs on the shared background loop, so this also works when called from a running loop (e.g. notebooks)
+        parsed_responses = run_async(gather_responses(state))
+        
+        # Only transient provider errors are ridden out - anything else would silence the agent every round
+        for parsed in parsed_responses:
+            if isinstance(parsed, BaseException) and not isinstance(parsed, TRANSIENT_API_ERRORS):
+                raise parsed
+        
+        # A round with no responses at all can't be debated or evaluated
+        if all(isinstance(parsed, BaseException) for parsed in parsed_responses):
+            raise RuntimeError("Every agent's request failed this round") from parsed_responses[0]
+        
+        # Merge responses in agent order once all of them have arrived
+        for agent, parsed in zip(agents, parsed_responses):
+            if isinstance(parsed, BaseException):
+                # One failed request (after the client's own retries) shouldn't discard the other agents' responses
+                print(f"Error getting response from {agent.config.name}: {parsed}")
+                parsed = {
+                    "response": "No response",
+                    "reasoning": "Request failed",
+                    "explanation": f"{type(parsed).__name__}: {parsed}",
+                    "failed": True
+                }
+            state = agent.apply_response(state, parsed)
+        
+        return state
+    
+    return parallel_debaters
 
 
 def build_consensus_graph():
@@ -15,6 +57,7 @@ def build_consensus_graph():
     agent_x = create_agent_x()
     agent_y = create_agent_y()
     agent_z = create_agent_z()
+    debaters = create_parallel_debaters_node([agent_x, agent_y, agent_z])
     
     # Create graph
     graph = StateGraph(AgentState)
@@ -24,31 +67,23 @@ def build_consensus_graph():
     
     # Add nodes
     graph.add_node("supervisor", supervisor.introduce_mission)
-    graph.add_node("agent_x", agent_x.process)
-    graph.add_node("agent_y", agent_y.process)
-    graph.add_node("agent_z", agent_z.process)
+    graph.add_node("debaters", debaters)
     graph.add_node("consensus_supervisor", supervisor.switch_to_consensus_mode)
-    graph.add_node("consensus_agent_x", agent_x.process)
-    graph.add_node("consensus_agent_y", agent_y.process)
-    graph.add_node("consensus_agent_z", agent_z.process)
+    graph.add_node("consensus_debaters", debaters)
     graph.add_node("consensus_evaluator", supervisor.evaluate_consensus)
     
     # Add edges for presentation mode
-    graph.add_edge("supervisor", "agent_x")
-    graph.add_edge("agent_x", "agent_y")
-    graph.add_edge("agent_y", "agent_z")
+    graph.add_edge("supervisor", "debaters")
     
     # Conditional edge: continue presentation or switch to consensus
     graph.add_conditional_edges(
-        "agent_z",
-        lambda x: "agent_x" if x["iteration_count"] < x["max_iterations"] else "consensus_supervisor"
+        "debaters",
+        lambda x: "debaters" if x["iteration_count"] < x["max_iterations"] else "consensus_supervisor"
     )
     
     # Consensus mode edges
-    graph.add_edge("consensus_supervisor", "consensus_agent_x")
-    graph.add_edge("consensus_agent_x", "consensus_agent_y")
-    graph.add_edge("consensus_agent_y", "consensus_agent_z")
-    graph.add_edge("consensus_agent_z", "consensus_evaluator")
+    graph.add_edge("consensus_supervisor", "consensus_debaters")
+    graph.add_edge("consensus_debaters", "consensus_evaluator")
     
     # After evaluation: either consensus reached (END) or continue loop
     graph.add_conditional_edges(
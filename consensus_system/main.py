@@ -3,14 +3,42 @@ Main entry point for the consensus system.
 """
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .state import create_initial_state
 from .graph.graph_builder import build_consensus_graph
+from .agents.models import configure_llm_cache
 from .config import AGENT_X_MODEL, AGENT_Y_MODEL, AGENT_Z_MODEL
 
+try:
+    import orjson
+except ImportError:  # Optional dependency - fall back to the stdlib encoder
+    orjson = None
+
+
+def write_json(path: str, data: dict):
+    """Write data to a pretty-printed UTF-8 JSON file with a single serialized buffer."""
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        content = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    
+    # O_BINARY keeps Windows from translating newlines
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(content)
+        while view:
+            # os.write may write fewer bytes than requested
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 def export_results_to_json(final_state, topic: str):
     """Export all results to JSON files in a unique output folder."""
+    # Capture the export time once so every file carries the same timestamp
+    export_timestamp = datetime.now().isoformat()
+    
     # Create unique output folder with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_folder = f"output_consensus_{timestamp}"
@@ -23,65 +51,53 @@ def export_results_to_json(final_state, topic: str):
         "consensus_reached": final_state["consensus_reached"],
         "total_iterations": final_state["iteration_count"],
         "consensus_rounds": final_state["consensus_round"],
-        "conversation_history": final_state["conversation_history"],
+        "conversation_history": list(final_state["conversation_history"]),
         "debate_winner": final_state.get("debate_winner", {}),
-        "export_timestamp": datetime.now().isoformat()
+        "export_timestamp": export_timestamp
     }
     
-    with open(f"{output_folder}/complete_conversation.json", "w", encoding="utf-8") as f:
-        json.dump(conversation_data, f, indent=2, ensure_ascii=False)
-    
     # Import agent configurations
     from .agents.prompts import AGENT_CONFIGS
     
     # 2. Export Agent X responses
     agent_x_data = {
         "agent_name": "AGENT_X",
-        "personality": AGENT_CONFIGS["agent_x"]["personality"],
-        "behavior": AGENT_CONFIGS["agent_x"]["behavior"],
+        "personality": AGENT_CONFIGS["agent_x"].personality,
+        "behavior": AGENT_CONFIGS["agent_x"].behavior,
         "model": AGENT_X_MODEL,
         "topic": topic,
         "responses": final_state["agent_x_messages"],
         "full_responses": final_state["agent_x_full_responses"],
         "total_responses": len(final_state["agent_x_messages"]),
-        "export_timestamp": datetime.now().isoformat()
+        "export_timestamp": export_timestamp
     }
     
-    with open(f"{output_folder}/agent_x_responses.json", "w", encoding="utf-8") as f:
-        json.dump(agent_x_data, f, indent=2, ensure_ascii=False)
-    
     # 3. Export Agent Y responses
     agent_y_data = {
         "agent_name": "AGENT_Y",
-        "personality": AGENT_CONFIGS["agent_y"]["personality"],
-        "behavior": AGENT_CONFIGS["agent_y"]["behavior"],
+        "personality": AGENT_CONFIGS["agent_y"].personality,
+        "behavior": AGENT_CONFIGS["agent_y"].behavior,
         "model": AGENT_Y_MODEL,
         "topic": topic,
         "responses": final_state["agent_y_messages"],
         "full_responses": final_state["agent_y_full_responses"],
         "total_responses": len(final_state["agent_y_messages"]),
-        "export_timestamp": datetime.now().isoformat()
+        "export_timestamp": export_timestamp
     }
     
-    with open(f"{output_folder}/agent_y_responses.json", "w", encoding="utf-8") as f:
-        json.dump(agent_y_data, f, indent=2, ensure_ascii=False)
-    
     # 4. Export Agent Z responses
     agent_z_data = {
         "agent_name": "AGENT_Z",
-        "personality": AGENT_CONFIGS["agent_z"]["personality"],
-        "behavior": AGENT_CONFIGS["agent_z"]["behavior"],
+        "personality": AGENT_CONFIGS["agent_z"].personality,
+        "behavior": AGENT_CONFIGS["agent_z"].behavior,
         "model": AGENT_Z_MODEL,
         "topic": topic,
         "responses": final_state["agent_z_messages"],
         "full_responses": final_state["agent_z_full_responses"],
         "total_responses": len(final_state["agent_z_messages"]),
-        "export_timestamp": datetime.now().isoformat()
+        "export_timestamp": export_timestamp
     }
     
-    with open(f"{output_folder}/agent_z_responses.json", "w", encoding="utf-8") as f:
-        json.dump(agent_z_data, f, indent=2, ensure_ascii=False)
-    
     # 5. Export summary statistics
     summary_data = {
         "topic": topic,
@@ -94,14 +110,27 @@ def export_results_to_json(final_state, topic: str):
             "agent_y": len(final_state["agent_y_messages"]),
             "agent_z": len(final_state["agent_z_messages"])
         },
+        "failed_turn_counts": {
+            "agent_x": sum(1 for response in final_state["agent_x_full_responses"] if response.get("failed")),
+            "agent_y": sum(1 for response in final_state["agent_y_full_responses"] if response.get("failed")),
+            "agent_z": sum(1 for response in final_state["agent_z_full_responses"] if response.get("failed"))
+        },
         "total_conversation_entries": len(final_state["conversation_history"]),
         "debate_winner": final_state.get("debate_winner", {}),
-        "export_timestamp": datetime.now().isoformat(),
+        "export_timestamp": export_timestamp,
         "output_folder": output_folder
     }
     
-    with open(f"{output_folder}/summary_statistics.json", "w", encoding="utf-8") as f:
-        json.dump(summary_data, f, indent=2, ensure_ascii=False)
+    # Write all files concurrently - each write is I/O bound
+    writes = [
+        (f"{output_folder}/complete_conversation.json", conversation_data),
+        (f"{output_folder}/agent_x_responses.json", agent_x_data),
+        (f"{output_folder}/agent_y_responses.json", agent_y_data),
+        (f"{output_folder}/agent_z_responses.json", agent_z_data),
+        (f"{output_folder}/summary_statistics.json", summary_data)
+    ]
+    with ThreadPoolExecutor(max_workers=len(writes)) as executor:
+        list(executor.map(lambda write: write_json(*write), writes))
     
     print(f"\n📁 Results exported to folder: {output_folder}")
     print(f"📊 Files created:")
@@ -124,6 +153,7 @@ def run_consensus_system(topic: str):
     initial_state = create_initial_state(topic)
     
     # Build and run graph
+    configure_llm_cache()
     graph = build_consensus_graph()
     
     try:
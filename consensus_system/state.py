@@ -1,12 +1,15 @@
 """
 Agent state definitions for the consensus system.
 """
-from typing import Dict, List, Literal, TypedDict
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Literal, Optional, TypedDict
 
 
 class AgentState(TypedDict):
     """State structure for the consensus system."""
-    conversation_history: List[str]      # All messages in format "AGENT: message"
+    conversation_history: Deque[str]     # All messages in format "AGENT: message"
+    conversation_history_str: str        # conversation_history joined with newlines
     iteration_count: int                 # Current iteration (0-5 for presentation mode)
     max_iterations: int                  # 5 iterations for presentation mode
     mode: Literal["presentation", "consensus"]  # Current system mode
@@ -28,7 +31,8 @@ class AgentState(TypedDict):
 def create_initial_state(topic: str) -> AgentState:
     """Create initial state for the consensus system."""
     return AgentState(
-        conversation_history=[],
+        conversation_history=deque(maxlen=None),
+        conversation_history_str="",
         iteration_count=0,
         max_iterations=2,
         mode="presentation",
@@ -46,3 +50,20 @@ def create_initial_state(topic: str) -> AgentState:
         agent_z_full_responses=[],
         debate_winner={}
     )
+
+
+def append_history(state: AgentState, entry: str) -> None:
+    """Append an entry to the conversation history and its cached joined string."""
+    state["conversation_history"].append(entry)
+    if state["conversation_history_str"]:
+        state["conversation_history_str"] += "\n" + entry
+    else:
+        state["conversation_history_str"] = entry
+
+
+def recent_history(state: AgentState, count: Optional[int]) -> str:
+    """Return the last `count` conversation entries joined with newlines."""
+    history = state["conversation_history"]
+    if count is None or len(history) <= count:
+        return state["conversation_history_str"]
+    return "\n".join(reversed(list(islice(reversed(history), count))))
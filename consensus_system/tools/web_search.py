@@ -1,12 +1,72 @@
 """
 Web search tool for agents using DuckDuckGo.
 """
-from langchain_community.tools import DuckDuckGoSearchRun
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from duckduckgo_search import DDGS
 
+NO_RESULTS_MESSAGE = "No good DuckDuckGo Search Result was found"
 
-def create_web_search_tool():
+
+class CachedWebSearch:
+    """DuckDuckGo text search with an LRU cache of recent results that expire after `ttl` seconds."""
+    
+    def __init__(self, max_results: int = 5, max_size: int = 512, ttl: float = 300.0):
+        self.max_results = max_results
+        self.max_size = max_size
+        self.ttl = ttl
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _cache_key(query: str) -> str:
+        """Hash a normalized query so trivially different spellings share a cache entry."""
+        return hashlib.sha256(query.strip().lower().encode("utf-8")).hexdigest()[:16]
+    
+    def _get_cached(self, key: str):
+        """Return a cached result that has not expired, or None."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, result = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._cache[key]
+                return None
+            
+            self._cache.move_to_end(key)
+            return result
+    
+    def _store(self, key: str, result: str):
+        """Cache a result, evicting the least recently used entry when full."""
+        with self._lock:
+            self._cache[key] = (time.monotonic(), result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+    
+    def search(self, query: str) -> str:
+        """Search the web and return the result snippets joined into one string."""
+        key = self._cache_key(query)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+        
+        # Query DuckDuckGo directly - same output format as the LangChain wrapper.
+        # Older duckduckgo-search versions return a generator (or None), so materialize it before checking for results
+        results = list(DDGS().text(query, max_results=self.max_results) or [])
+        result = " ".join(r["body"] for r in results) if results else NO_RESULTS_MESSAGE
+        
+        self._store(key, result)
+        return result
+
+
+def create_web_search_tool() -> CachedWebSearch:
     """Create web search tool for agents."""
-    return DuckDuckGoSearchRun()
+    return CachedWebSearch()
 
 
 # Global web search tool instance
@@ -0,0 +1,19 @@
+"""
+Shared background event loop for running async LLM calls from synchronous graph nodes.
+"""
+import asyncio
+import threading
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the long-lived event loop for async LLM calls, starting it on first use."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="llm-event-loop", daemon=True).start()
+    return loop
+
+
+def run_async(coroutine):
+    """Run a coroutine on the shared event loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coroutine, get_event_loop()).result()
@@ -0,0 +1,65 @@
+"""
+Client-side rate limiting for LLM requests.
+"""
+import asyncio
+import threading
+import time
+from functools import lru_cache
+from ..config import RATE_LIMITS, DEFAULT_RATE_LIMIT, OUTPUT_TOKENS_ESTIMATE
+
+
+class TokenBucket:
+    """Token bucket that refills continuously up to `capacity` tokens per minute."""
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.refill_rate = capacity / 60.0
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, amount: float) -> float:
+        """Take `amount` tokens and return how many seconds to wait before they are available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+            self.updated_at = now
+            
+            # A single oversized request waits for at most one full bucket
+            self.tokens -= min(amount, self.capacity)
+            return max(0.0, -self.tokens / self.refill_rate)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits for one model."""
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+    
+    def _reserve(self, estimated_tokens: int) -> float:
+        """Reserve one request and its tokens, returning the longer of the two waits."""
+        return max(self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+    
+    async def acquire(self, estimated_tokens: int):
+        """Wait asynchronously until a request of the given size fits both limits."""
+        delay = self._reserve(estimated_tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def acquire_sync(self, estimated_tokens: int):
+        """Block until a request of the given size fits both limits."""
+        delay = self._reserve(estimated_tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def estimate_tokens(prompt: str) -> int:
+    """Roughly estimate the tokens a request consumes (about 4 characters per token plus output)."""
+    return len(prompt) // 4 + OUTPUT_TOKENS_ESTIMATE
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter(model_name: str) -> RateLimiter:
+    """Return the shared rate limiter for a model, so agents using the same model share its limits."""
+    return RateLimiter(**RATE_LIMITS.get(model_name, DEFAULT_RATE_LIMIT))
@@ -2,20 +2,83 @@
 Response parsing utilities for agent outputs.
 """
 import json
-from typing import Dict, Optional
+import re
+from typing import Dict, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional dependency - fall back to the stdlib parser
+    orjson = None
+
+# Characters that change brace depth or string state while scanning for JSON objects
+_JSON_SCAN_PATTERN = re.compile(r'[{}"\\]')
+
+
+def loads_json(text: str):
+    """Parse JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def iter_json_objects(text: str) -> Iterator[str]:
+    """Yield each balanced top-level {...} block in text, ignoring braces inside JSON strings."""
+    depth = 0
+    start = 0
+    in_string = False
+    skip_index = -1
+    
+    # Only visit the characters that matter instead of stepping through every one
+    for match in _JSON_SCAN_PATTERN.finditer(text):
+        index = match.start()
+        char = match.group()
+        
+        if in_string:
+            if index == skip_index:
+                continue
+            if char == '\\':
+                skip_index = index + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            # Quotes in the surrounding prose don't start JSON strings
+            in_string = depth > 0
+        elif char == '{':
+            if depth == 0:
+                start = index
+            depth += 1
+        elif char == '}' and depth > 0:
+            depth -= 1
+            if depth == 0:
+                yield text[start:index + 1]
+
+
+def first_response_object(text: str) -> Optional[Dict]:
+    """Return the first embedded JSON object with a "response" field, skipping stray objects before it."""
+    for json_str in iter_json_objects(text):
+        try:
+            parsed = loads_json(json_str)
+        except ValueError:
+            continue
+        if isinstance(parsed, dict) and "response" in parsed:
+            return parsed
+    return None
 
 
 def parse_agent_response(response: str) -> Optional[Dict]:
     """Parse agent JSON response with error handling."""
     try:
         # Try to extract JSON from response if it's embedded in text
-        if '{' in response and '}' in response:
-            start = response.find('{')
-            end = response.rfind('}') + 1
-            json_str = response[start:end]
-            parsed = json.loads(json_str)
-        else:
-            parsed = json.loads(response)
+        parsed = first_response_object(response)
+        if parsed is None:
+            # Fall back to the outermost braces, or the whole text
+            if '{' in response and '}' in response:
+                start = response.find('{')
+                end = response.rfind('}') + 1
+                json_str = response[start:end]
+                parsed = loads_json(json_str)
+            else:
+                parsed = loads_json(response)
             
         required_fields = ["response", "reasoning", "explanation"]
         
@@ -0,0 +1,12 @@
+"""
+Text normalization utilities for comparing agent positions.
+"""
+import re
+from typing import Tuple
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def normalize_tokens(text: str) -> Tuple[str, ...]:
+    """Lowercase text and split it into its sequence of word tokens, dropping punctuation and spacing."""
+    return tuple(TOKEN_PATTERN.findall(text.lower()))